@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from pathlib import Path
 
-from .const import DATA_KEY, DOMAIN
+from .const import DATA_KEY, DOMAIN, SERVICE_REPLAY
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _ensure_media_folder(hass) -> str:
+def _is_recording_file(name: str) -> bool:
+    """Return True for recordings (and partial uploads) written by this integration."""
+    return name.startswith("voice_recording_") and name.endswith((".mp3", ".part"))
+
+
+def _ensure_media_folder(hass) -> Path:
     """Ensure the voice recordings media folder exists and return its path."""
     # /media/local URL maps to /media filesystem path, so use /media directly
-    media_path = "/media"
+    media_path = Path("/media")
     # Don't create subdirectories - files go directly in /media
-    Path(media_path).mkdir(parents=True, exist_ok=True)
+    media_path.mkdir(parents=True, exist_ok=True)
     _LOGGER.info("Voice recordings will be saved to: %s", media_path)
     return media_path
 
@@ -24,102 +30,132 @@ def _ensure_media_folder(hass) -> str:
 def _cleanup_media_folder(hass) -> None:
     """Clean up voice recording files from media folder on integration unload."""
     try:
-        media_path = "/media"
-        if os.path.exists(media_path):
+        # Reuse the path resolved at setup instead of rebuilding it
+        media_path = hass.data.get(DOMAIN, {}).get("media_folder_path")
+        if media_path is None:
+            return
+        try:
+            it = os.scandir(media_path)
+        except FileNotFoundError:
+            return
+        with it:
             # Only remove voice recording files (don't touch other media files)
-            for filename in os.listdir(media_path):
-                if filename.startswith("voice_recording_") and filename.endswith(
-                    ".mp3"
+            for entry in it:
+                if _is_recording_file(entry.name) and entry.is_file(
+                    follow_symlinks=False
                 ):
-                    file_path = os.path.join(media_path, filename)
-                    if os.path.isfile(file_path):
-                        os.remove(file_path)
-                        _LOGGER.debug("Removed voice recording file: %s", filename)
-            _LOGGER.info("Cleaned up voice recording files from media folder")
+                    try:
+                        os.unlink(entry.path)
+                    except OSError as e:
+                        # Keep going so one stale entry doesn't leave the rest behind
+                        _LOGGER.debug("Could not remove %s: %s", entry.name, e)
+                        continue
+                    _LOGGER.debug("Removed voice recording file: %s", entry.name)
+        _LOGGER.info("Cleaned up voice recording files from media folder")
     except Exception as e:
         _LOGGER.warning("Could not cleanup voice recording files: %s", e)
 
 
+# Lazy imports to avoid importing Home Assistant modules at package import time.
+# The loaders are cached so reloads don't go through the import machinery again.
+@functools.cache
+def _get_services():
+    """Return the services module, importing it on first use."""
+    from . import services
+
+    return services
+
+
+@functools.cache
+def _get_ui():
+    """Return the ui module, importing it on first use."""
+    from . import ui
+
+    return ui
+
+
+def _domain_bucket(hass) -> dict:
+    """Return the integration's hass.data dict, creating it on first use."""
+    bucket = hass.data.setdefault(DOMAIN, {})
+    bucket.setdefault(DATA_KEY, {})
+    return bucket
+
+
+# (tts_config key, options key, default)
+_TTS_DEFAULTS = (
+    ("engine", "tts_engine", "auto"),
+    ("language", "tts_language", "de_DE"),
+    ("voice", "tts_voice", None),
+    ("speaker", "tts_speaker", None),
+    ("volume_boost_enabled", "volume_boost_enabled", True),
+    ("volume_boost_amount", "volume_boost_amount", 0.1),
+    ("prepend_silence_seconds", "prepend_silence_seconds", 3),
+)
+
+
+def _build_tts_config(entry) -> dict:
+    """Build the TTS configuration dict from the config entry options."""
+    opts = entry.options
+    return {key: opts.get(option, default) for key, option, default in _TTS_DEFAULTS}
+
+
 async def async_setup(hass, config: dict) -> bool:
     """Set up the integration from YAML (or on startup)."""
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN].setdefault(DATA_KEY, {})
-
-    # Lazy import to avoid importing Home Assistant modules at package import time
-    from . import services as services_mod
+    _domain_bucket(hass)
 
     # Register services for immediate availability (YAML installs).
-    services_mod.register_services(hass)
+    _get_services().register_services(hass)
 
     return True
 
 
 async def async_setup_entry(hass, entry) -> bool:
     """Set up the integration from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN].setdefault(DATA_KEY, {})
+    bucket = _domain_bucket(hass)
 
-    # Create the media folder for voice recordings
-    media_folder_path = _ensure_media_folder(hass)
-    hass.data[DOMAIN]["media_folder_path"] = media_folder_path
+    # Create the media folder for voice recordings (off the event loop)
+    media_folder_path = await hass.async_add_executor_job(_ensure_media_folder, hass)
+    bucket["media_folder_path"] = media_folder_path
 
     # Store TTS configuration from options
-    tts_config = {
-        "engine": entry.options.get("tts_engine", "auto"),
-        "language": entry.options.get("tts_language", "de_DE"),
-        "voice": entry.options.get("tts_voice"),
-        "speaker": entry.options.get("tts_speaker"),  # Add speaker support
-        "volume_boost_enabled": entry.options.get("volume_boost_enabled", True),
-        "volume_boost_amount": entry.options.get("volume_boost_amount", 0.1),
-        "prepend_silence_seconds": entry.options.get("prepend_silence_seconds", 3),
-    }
-    hass.data[DOMAIN]["tts_config"] = tts_config
-
-    # Lazy imports that require Home Assistant runtime
-    from . import services as services_mod
-    from . import ui as ui_mod
+    tts_config = _build_tts_config(entry)
+    bucket["tts_config"] = tts_config
 
     # Ensure service registration
-    services_mod.register_services(hass)
+    _get_services().register_services(hass)
 
-    # Register the API views for backend functionality
-    ui_mod.register_ui_view(hass)
+    # Register the API views for backend functionality; the media players
+    # state listener is stopped together with the entry
+    entry.async_on_unload(_get_ui().register_ui_view(hass))
 
     # Listen for options updates
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
-    _LOGGER.debug(
-        "Voice Replay integration set up successfully with TTS config: %s", tts_config
-    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Voice Replay integration set up successfully with TTS config: %s",
+            tts_config,
+        )
     return True
 
 
 async def async_update_options(hass, entry) -> None:
     """Update options when they change."""
     # Update stored TTS configuration
-    tts_config = {
-        "engine": entry.options.get("tts_engine", "auto"),
-        "language": entry.options.get("tts_language", "de_DE"),
-        "voice": entry.options.get("tts_voice"),
-        "speaker": entry.options.get("tts_speaker"),  # Add speaker support
-        "volume_boost_enabled": entry.options.get("volume_boost_enabled", True),
-        "volume_boost_amount": entry.options.get("volume_boost_amount", 0.1),
-        "prepend_silence_seconds": entry.options.get("prepend_silence_seconds", 3),
-    }
+    tts_config = _build_tts_config(entry)
     hass.data[DOMAIN]["tts_config"] = tts_config
-    _LOGGER.debug("Updated TTS config: %s", tts_config)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Updated TTS config: %s", tts_config)
 
 
 async def async_unload_entry(hass, entry) -> bool:
     """Unload a config entry."""
-    # Try to remove the service (silent if not present).
-    try:
-        hass.services.async_remove(DOMAIN, "replay")
-    except Exception:
-        _LOGGER.debug("Service removal failed or service not present", exc_info=True)
+    # Remove the service if it is registered.
+    if hass.services.has_service(DOMAIN, SERVICE_REPLAY):
+        hass.services.async_remove(DOMAIN, SERVICE_REPLAY)
 
-    # Clean up the media folder
-    _cleanup_media_folder(hass)
+    # Clean up the media folder (off the event loop)
+    await hass.async_add_executor_job(_cleanup_media_folder, hass)
 
     # Clear stored data for this integration instance
     hass.data.pop(DOMAIN, None)
@@ -2,17 +2,126 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import re
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import callback
+from homeassistant.core import State, callback
 from homeassistant.helpers import selector
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# How long the TTS engine list is reused between options form renders
+_ENGINES_CACHE_TTL = 15.0
+
+# Above this many options a language or voice dropdown falls back to a text box
+_MAX_DROPDOWN_OPTIONS = 500
+
+# Piper-style voice names: "<language>-<speaker>-<quality>", e.g. "de_DE-thorsten-low"
+_VOICE_RE = re.compile(
+    r"^(?P<lang>[a-z]{2}(?:_[A-Z]{2})?)-(?P<speaker>[^-]+)-(?P<quality>x_low|low|medium|high)$"
+)
+_VOICE_QUALITIES = frozenset({"low", "medium", "high", "x_low", "x-low"})
+
+# Attribute prefixes used by Piper/Wyoming engines
+_VOICES_PREFIX = "voices_"
+_SPEAKERS_PREFIX = "speakers_"
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_voice(voice: str) -> tuple[str, str, str] | None:
+    """Split a Piper-style voice name into (language, speaker, quality)."""
+    match = _VOICE_RE.match(voice)
+    if match is None:
+        return None
+    return match.group("lang", "speaker", "quality")
+
+
+# Language options offered when the engine doesn't report its languages
+_FALLBACK_LANGUAGES = (
+    {"value": "de_DE", "label": "German (de_DE)"},
+    {"value": "de", "label": "German (de)"},
+    {"value": "en_US", "label": "English US (en_US)"},
+    {"value": "en", "label": "English (en)"},
+    {"value": "fr", "label": "French (fr)"},
+    {"value": "es", "label": "Spanish (es)"},
+    {"value": "it", "label": "Italian (it)"},
+)
+
+# ISO 639-1 codes, used to recognise a bare language prefix in voice names
+_ISO_639_1 = frozenset(
+    """
+    aa ab ae af ak am an ar as av ay az ba be bg bh bi bm bn bo br bs ca ce ch
+    co cr cs cu cv cy da de dv dz ee el en eo es et eu fa ff fi fj fo fr fy ga
+    gd gl gn gu gv ha he hi ho hr ht hu hy hz ia id ie ig ii ik io is it iu ja
+    jv ka kg ki kj kk kl km kn ko kr ks ku kv kw ky la lb lg li ln lo lt lu lv
+    mg mh mi mk ml mn mr ms mt my na nb nd ne ng nl nn no nr nv ny oc oj om or
+    os pa pi pl ps pt qu rm rn ro ru rw sa sc sd se sg si sk sl sm sn so sq sr
+    ss st su sv sw ta te tg th ti tk tl tn to tr ts tt tw ty ug uk ur uz ve vi
+    vo wa wo xh yi yo za zh zu
+    """.split()
+)
+
+# Common language mappings for option labels
+_LANG_MAP = {
+    "de": "German",
+    "de-DE": "German (Germany)",
+    "de_DE": "German (Germany)",
+    "en": "English",
+    "en-US": "English (US)",
+    "en-GB": "English (UK)",
+    "en_US": "English (US)",
+    "en_GB": "English (UK)",
+    "fr": "French",
+    "fr-FR": "French (France)",
+    "fr_FR": "French (France)",
+    "es": "Spanish",
+    "es-ES": "Spanish (Spain)",
+    "es_ES": "Spanish (Spain)",
+    "it": "Italian",
+    "it-IT": "Italian (Italy)",
+    "it_IT": "Italian (Italy)",
+}
+
+# Option labels for the known language codes, formatted once at import
+_LANG_LABELS = {code: f"{name} ({code})" for code, name in _LANG_MAP.items()}
+
+# Selectors whose configuration never changes are built once
+_FALLBACK_LANGUAGE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=list(_FALLBACK_LANGUAGES),
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+_VOLUME_BOOST_ENABLED_SELECTOR = selector.BooleanSelector()
+_VOLUME_BOOST_AMOUNT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0.05,
+        max=0.3,
+        step=0.05,
+        mode=selector.NumberSelectorMode.SLIDER,
+    )
+)
+_PREPEND_SILENCE_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=10,
+        step=1,
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+
+# No configuration needed for native UI
+_USER_STEP_SCHEMA = vol.Schema({})
+
 
 class VoiceReplayFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Voice Replay."""
@@ -25,11 +134,8 @@ class VoiceReplayFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             return self.async_create_entry(title="Voice Replay", data=user_input)
 
-        # No configuration needed for native UI
-        data_schema = vol.Schema({})
-
         return self.async_show_form(
-            step_id="user", data_schema=data_schema, errors=errors
+            step_id="user", data_schema=_USER_STEP_SCHEMA, errors=errors
         )
 
     @staticmethod
@@ -46,11 +152,29 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
         """Initialize options flow."""
         self.config_entry = config_entry
         self._current_config = dict(config_entry.options)
+        self._engines_cache: tuple[float, int, list[dict]] | None = None
+        self._lang_cache: dict[tuple[str, datetime], list[str]] = {}
+        self._voice_cache: dict[tuple[str, str, datetime], list[str]] = {}
+        self._piper_index_cache: dict[tuple[str, datetime], dict[str, Any]] = {}
+        self._validated_selections: set[tuple] = set()
+        self._engine_kind_cache: dict[str, str] = {}
+        self._schema_cache: tuple[tuple, vol.Schema] | None = None
+        self._state_cache: dict[str, State | None] = {}
+        self._speaker_cache: dict[tuple[str, str, datetime], list[str]] = {}
+        self._lowered_voice_cache: dict[
+            tuple[str, datetime], list[tuple[str, str]]
+        ] = {}
+        self._voice_options_cache: dict[tuple[str, str, datetime], list[dict]] = {}
+        # (engine, language, voices, voice set) shown by the last form render
+        self._rendered_voices: tuple[str, str, list[str], frozenset] | None = None
 
     async def async_step_init(self, user_input=None):
         """Manage all TTS configuration in a single step."""
         errors = {}
 
+        # Look states up fresh each time the step is (re-)entered
+        self._state_cache.clear()
+
         if user_input is not None:
             # Parse combined voice-speaker selection if present
             combined_voice = user_input.get("tts_voice_combined")
@@ -65,22 +189,59 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
             selected_voice = user_input.get("tts_voice")
             selected_speaker = user_input.get("tts_speaker")
 
+            # Skip validation if the selection is unchanged or was already validated
+            selection = (
+                selected_engine,
+                selected_language,
+                selected_voice,
+                selected_speaker,
+            )
+            options = self.config_entry.options
+            stored_selection = (
+                options.get("tts_engine", "auto"),
+                options.get("tts_language", "de_DE"),
+                options.get("tts_voice"),
+                options.get("tts_speaker"),
+            )
+            needs_validation = (
+                selection != stored_selection
+                and selection not in self._validated_selections
+            )
+
             # Validate voice if specified
-            if selected_voice and selected_engine != "auto":
-                available_voices = await self._get_engine_voices_for_language(
-                    selected_engine, selected_language
-                )
-                if available_voices and selected_voice not in available_voices:
+            available_voices = None
+            if needs_validation and selected_voice and selected_engine != "auto":
+                # Reuse the voices the form was rendered with when they still apply
+                rendered = self._rendered_voices
+                if rendered is not None and rendered[:2] == (
+                    selected_engine,
+                    selected_language,
+                ):
+                    available_voices, voice_set = rendered[2], rendered[3]
+                else:
+                    available_voices = self._get_engine_voices_for_language(
+                        selected_engine, selected_language
+                    )
+                    voice_set = frozenset(available_voices)
+                if available_voices and selected_voice not in voice_set:
                     errors["tts_voice_combined"] = "voice_not_available"
 
             # Validate speaker if specified
-            if selected_speaker and selected_voice and selected_engine != "auto":
-                is_valid = await self._validate_voice_speaker_combination(
-                    selected_engine, selected_voice, selected_speaker
+            if (
+                needs_validation
+                and selected_speaker
+                and selected_voice
+                and selected_engine != "auto"
+            ):
+                is_valid = self._validate_voice_speaker_combination(
+                    selected_engine, selected_voice, selected_speaker, available_voices
                 )
                 if not is_valid:
                     errors["tts_voice_combined"] = "speaker_not_available"
 
+            if needs_validation and not errors:
+                self._validated_selections.add(selection)
+
             if not errors:
                 # Remove the combined field from the final data
                 final_data = dict(user_input)
@@ -90,17 +251,69 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
         # Get current settings
         current_engine = self.config_entry.options.get("tts_engine", "auto")
         current_language = self.config_entry.options.get("tts_language", "de_DE")
-        current_voice = self.config_entry.options.get("tts_voice")
-        current_speaker = self.config_entry.options.get("tts_speaker")
 
         # Get available options
-        tts_engines = await self._get_tts_engines()
-        available_languages = await self._get_engine_languages(current_engine)
+        tts_engines = self._get_tts_engines()
+        available_languages = self._get_engine_languages(current_engine)
 
         # Get combined voice-speaker options
-        combined_voice_options = await self._get_combined_voice_options(
+        available_voices = self._get_engine_voices_for_language(
             current_engine, current_language
         )
+        combined_voice_options = self._get_combined_voice_options(
+            current_engine, current_language, available_voices
+        )
+        self._rendered_voices = (
+            current_engine,
+            current_language,
+            available_voices,
+            frozenset(available_voices),
+        )
+
+        # Reuse the schema from the previous render when its inputs are unchanged.
+        # Defaults come from the entry options, which are fixed for this flow.
+        schema_key = (
+            tuple((engine["value"], engine["label"]) for engine in tts_engines),
+            tuple(available_languages),
+            tuple(option["value"] for option in combined_voice_options),
+        )
+        if self._schema_cache is not None and self._schema_cache[0] == schema_key:
+            data_schema = self._schema_cache[1]
+        else:
+            data_schema = self._build_init_schema(
+                current_engine,
+                current_language,
+                tts_engines,
+                available_languages,
+                combined_voice_options,
+            )
+            self._schema_cache = (schema_key, data_schema)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=data_schema,
+            errors=errors,
+            description_placeholders={
+                "engine": current_engine,
+                "language": current_language,
+                "voice_count": str(len(combined_voice_options))
+                if combined_voice_options
+                else "0",
+                "speaker_count": "auto-detected",  # Speakers are now included in voice options
+            },
+        )
+
+    def _build_init_schema(
+        self,
+        current_engine: str,
+        current_language: str,
+        tts_engines: list[dict],
+        available_languages: list[str],
+        combined_voice_options: list[dict],
+    ) -> vol.Schema:
+        """Build the options form schema from the available TTS options."""
+        current_voice = self.config_entry.options.get("tts_voice")
+        current_speaker = self.config_entry.options.get("tts_speaker")
 
         # Determine current combined voice value
         current_combined_voice = None
@@ -124,34 +337,43 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
         )
 
         # Language selection
-        if available_languages:
+        if len(available_languages) > _MAX_DROPDOWN_OPTIONS:
+            _LOGGER.warning(
+                "Engine %s offers %d languages, using text input instead of a dropdown",
+                current_engine,
+                len(available_languages),
+            )
+            language_selector = selector.TextSelector()
+        elif available_languages:
             language_options = []
             for lang in available_languages:
                 label = self._format_language_label(lang)
                 language_options.append({"value": lang, "label": label})
-        else:
-            # Default language options
-            language_options = [
-                {"value": "de_DE", "label": "German (de_DE)"},
-                {"value": "de", "label": "German (de)"},
-                {"value": "en_US", "label": "English US (en_US)"},
-                {"value": "en", "label": "English (en)"},
-                {"value": "fr", "label": "French (fr)"},
-                {"value": "es", "label": "Spanish (es)"},
-                {"value": "it", "label": "Italian (it)"},
-            ]
-
-        data_schema_dict[vol.Optional("tts_language", default=current_language)] = (
-            selector.SelectSelector(
+            language_selector = selector.SelectSelector(
                 selector.SelectSelectorConfig(
                     options=language_options,
                     mode=selector.SelectSelectorMode.DROPDOWN,
                 )
             )
+        else:
+            # Default language options
+            language_selector = _FALLBACK_LANGUAGE_SELECTOR
+
+        data_schema_dict[vol.Optional("tts_language", default=current_language)] = (
+            language_selector
         )
 
         # Combined Voice and Speaker selection
-        if combined_voice_options:
+        if len(combined_voice_options) > _MAX_DROPDOWN_OPTIONS:
+            _LOGGER.warning(
+                "Engine %s offers %d voice options, using text input instead of a dropdown",
+                current_engine,
+                len(combined_voice_options),
+            )
+            data_schema_dict[
+                vol.Optional("tts_voice_combined", default=current_combined_voice or "")
+            ] = selector.TextSelector()
+        elif combined_voice_options:
             data_schema_dict[
                 vol.Optional("tts_voice_combined", default=current_combined_voice)
             ] = selector.SelectSelector(
@@ -166,7 +388,6 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Optional("tts_voice_combined", default=current_combined_voice or "")
             ] = selector.TextSelector()
 
-        # Sonos announcement options
         # Volume boost configuration
         current_volume_enabled = self.config_entry.options.get(
             "volume_boost_enabled", True
@@ -177,18 +398,11 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
 
         data_schema_dict[
             vol.Optional("volume_boost_enabled", default=current_volume_enabled)
-        ] = selector.BooleanSelector()
+        ] = _VOLUME_BOOST_ENABLED_SELECTOR
 
         data_schema_dict[
             vol.Optional("volume_boost_amount", default=current_volume_increase)
-        ] = selector.NumberSelector(
-            selector.NumberSelectorConfig(
-                min=0.05,
-                max=0.3,
-                step=0.05,
-                mode=selector.NumberSelectorMode.SLIDER,
-            )
-        )
+        ] = _VOLUME_BOOST_AMOUNT_SELECTOR
 
         # Recording silence prepend configuration
         current_prepend_silence = self.config_entry.options.get(
@@ -197,101 +411,100 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
 
         data_schema_dict[
             vol.Optional("prepend_silence_seconds", default=current_prepend_silence)
-        ] = selector.NumberSelector(
-            selector.NumberSelectorConfig(
-                min=0,
-                max=10,
-                step=1,
-                mode=selector.NumberSelectorMode.BOX,
-            )
-        )
+        ] = _PREPEND_SILENCE_SELECTOR
 
-        data_schema = vol.Schema(data_schema_dict)
+        return vol.Schema(data_schema_dict)
 
-        return self.async_show_form(
-            step_id="init",
-            data_schema=data_schema,
-            errors=errors,
-            description_placeholders={
-                "engine": current_engine,
-                "language": current_language,
-                "voice_count": str(len(combined_voice_options))
-                if combined_voice_options
-                else "0",
-                "speaker_count": "auto-detected",  # Speakers are now included in voice options
-            },
-        )
+    def _get_state(self, entity_id: str) -> State | None:
+        """Return an entity state, memoized for the current flow step."""
+        if entity_id in self._state_cache:
+            return self._state_cache[entity_id]
+        state = self.hass.states.get(entity_id)
+        self._state_cache[entity_id] = state
+        return state
 
-    async def _get_tts_engines(self) -> list[dict]:
+    def _get_tts_engines(self) -> list[dict]:
         """Get available TTS engines."""
+        # Only look at the tts domain instead of scanning every state
+        entity_ids = self.hass.states.async_entity_ids("tts")
+        now = time.monotonic()
+
+        # Reuse the cached list while it is fresh and no engine was added/removed
+        if self._engines_cache is not None:
+            cached_at, cached_count, cached_engines = self._engines_cache
+            if now - cached_at < _ENGINES_CACHE_TTL and cached_count == len(entity_ids):
+                return cached_engines
+
         engines = []
 
         # Add "Auto-detect" option
         engines.append({"value": "auto", "label": "Auto-detect"})
 
         # Get all available TTS entities
-        for state in self.hass.states.async_all():
-            if state.entity_id.startswith("tts.") and state.state != "unavailable":
-                friendly_name = state.attributes.get("friendly_name", state.entity_id)
-                engines.append({"value": state.entity_id, "label": friendly_name})
+        for entity_id in entity_ids:
+            state = self._get_state(entity_id)
+            if state and state.state != "unavailable":
+                friendly_name = state.attributes.get("friendly_name", entity_id)
+                engines.append({"value": entity_id, "label": friendly_name})
 
+        self._engines_cache = (now, len(entity_ids), engines)
         return engines
 
-    async def _get_engine_languages(self, engine_entity_id: str) -> list[str]:
+    def _get_engine_languages(self, engine_entity_id: str) -> list[str]:
         """Get available languages for a TTS engine."""
         if engine_entity_id == "auto":
             return []
 
-        try:
-            state = self.hass.states.get(engine_entity_id)
-            if not state:
-                return []
+        state = self._get_state(engine_entity_id)
+        if not state:
+            return []
 
+        # Reuse the result until the engine state changes
+        cache_key = (engine_entity_id, state.last_updated)
+        languages = self._lang_cache.get(cache_key)
+        if languages is None:
+            languages = self._languages_from_state(engine_entity_id, state)
+            self._lang_cache[cache_key] = languages
+        return languages
+
+    def _languages_from_state(self, engine_entity_id: str, state: State) -> list[str]:
+        """Derive available languages from a TTS engine state."""
+        attrs = state.attributes
+        try:
             # Method 1: Check for supported_languages attribute
-            languages = state.attributes.get(
-                "supported_languages"
-            ) or state.attributes.get("languages")
+            languages = attrs.get("supported_languages") or attrs.get("languages")
             if languages and isinstance(languages, (list, tuple)):
                 return list(languages)
 
             # Method 2: For Piper TTS, check for voice attributes that indicate languages
             # Piper often has attributes like "voices_de_DE", "voices_en_US", etc.
-            if (
-                "piper" in engine_entity_id.lower()
-                or "wyoming" in engine_entity_id.lower()
-            ):
-                piper_languages = []
-                for attr_name in state.attributes:
-                    if attr_name.startswith("voices_"):
-                        # Extract language from "voices_de_DE" -> "de_DE"
-                        lang_code = attr_name.replace("voices_", "")
-                        if lang_code and lang_code not in piper_languages:
-                            piper_languages.append(lang_code)
+            if self._engine_kind(engine_entity_id) in ("piper", "wyoming"):
+                piper_languages = sorted(self._piper_index(engine_entity_id, state))
                 if piper_languages:
                     # Debug logging to see what languages we found
-                    _LOGGER.info(
-                        "Found Piper/Wyoming languages for %s: %s",
-                        engine_entity_id,
-                        piper_languages,
-                    )
-                    return sorted(piper_languages)
+                    if _LOGGER.isEnabledFor(logging.INFO):
+                        _LOGGER.info(
+                            "Found Piper/Wyoming languages for %s: %s",
+                            engine_entity_id,
+                            piper_languages,
+                        )
+                    return piper_languages
 
                 # Alternative method for Wyoming: check supported_languages
-                if hasattr(state, "entity") and hasattr(
-                    state.entity, "supported_languages"
-                ):
-                    return list(state.entity.supported_languages)
+                entity_languages = getattr(
+                    getattr(state, "entity", None), "supported_languages", None
+                )
+                if entity_languages is not None:
+                    return list(entity_languages)
 
                 # Check for voice information in supported_voices attribute
-                supported_voices = state.attributes.get("supported_voices")
+                supported_voices = attrs.get("supported_voices")
                 if supported_voices and isinstance(supported_voices, dict):
                     # supported_voices might be structured like {"en-US": [...], "de-DE": [...]}
                     return sorted(supported_voices.keys())
 
             # Method 3: Check if voices attribute contains language info
-            voices = state.attributes.get("voices") or state.attributes.get(
-                "available_voices"
-            )
+            voices = attrs.get("voices") or attrs.get("available_voices")
             if voices and isinstance(voices, (list, tuple)):
                 # Try to extract unique languages from voice names
                 # Voice names might be like "de_DE-eva-low" or similar
@@ -299,14 +512,10 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
                 for voice in voices:
                     if isinstance(voice, str):
                         # Look for language patterns in voice names
-                        parts = voice.split("-")
-                        if len(parts) > 0:
-                            first_part = parts[0]
-                            # Check if it looks like a language code
-                            if "_" in first_part or (
-                                len(first_part) == 2 and first_part.isalpha()
-                            ):
-                                detected_languages.add(first_part)
+                        first_part = voice.partition("-")[0]
+                        # Check if it looks like a language code
+                        if "_" in first_part or first_part in _ISO_639_1:
+                            detected_languages.add(first_part)
                 if detected_languages:
                     return sorted(detected_languages)
 
@@ -314,30 +523,58 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
             pass
         return []
 
-    async def _get_engine_voices_for_language(
+    def _piper_index(self, engine_entity_id: str, state: State) -> dict[str, Any]:
+        """Index "voices_<lang>" attributes by language code.
+
+        Built in a single pass per engine state and shared by the language
+        and voice lookups.
+        """
+        cache_key = (engine_entity_id, state.last_updated)
+        index = self._piper_index_cache.get(cache_key)
+        if index is None:
+            # Extract language from "voices_de_DE" -> "de_DE", skipping a bare prefix
+            prefix_len = len(_VOICES_PREFIX)
+            index = {
+                attr_name[prefix_len:]: value
+                for attr_name, value in state.attributes.items()
+                if len(attr_name) > prefix_len and attr_name.startswith(_VOICES_PREFIX)
+            }
+            self._piper_index_cache[cache_key] = index
+        return index
+
+    def _get_engine_voices_for_language(
         self, engine_entity_id: str, language: str
     ) -> list[str]:
         """Get available voices for a TTS engine and specific language."""
         if engine_entity_id == "auto":
             return []
 
-        try:
-            state = self.hass.states.get(engine_entity_id)
-            if not state:
-                return []
+        state = self._get_state(engine_entity_id)
+        if not state:
+            return []
 
+        # Reuse the result until the engine state changes
+        cache_key = (engine_entity_id, language, state.last_updated)
+        voices = self._voice_cache.get(cache_key)
+        if voices is None:
+            voices = self._voices_from_state(engine_entity_id, state, language)
+            self._voice_cache[cache_key] = voices
+        return voices
+
+    def _voices_from_state(
+        self, engine_entity_id: str, state: State, language: str
+    ) -> list[str]:
+        """Derive available voices for a language from a TTS engine state."""
+        attrs = state.attributes
+        try:
             # Method 1: Check for language-specific voices (e.g., voices_de, voices_en)
-            lang_voices_key = f"voices_{language}"
-            lang_voices = state.attributes.get(lang_voices_key)
+            lang_voices = self._piper_index(engine_entity_id, state).get(language)
             if lang_voices and isinstance(lang_voices, (list, tuple)):
                 return list(lang_voices)
 
             # Method 2: For Wyoming TTS entities, check supported_voices attribute
-            if (
-                "wyoming" in engine_entity_id.lower()
-                or "piper" in engine_entity_id.lower()
-            ):
-                supported_voices = state.attributes.get("supported_voices")
+            if self._engine_kind(engine_entity_id) in ("wyoming", "piper"):
+                supported_voices = attrs.get("supported_voices")
                 if supported_voices and isinstance(supported_voices, dict):
                     # supported_voices might be {"en-US": [voice1, voice2], "de-DE": [...]}
                     lang_voices = supported_voices.get(language, [])
@@ -345,10 +582,12 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
                         return list(lang_voices)
 
                     # Try alternative language formats
+                    language_lower = language.lower()
                     for lang_key in supported_voices:
+                        lang_key_lower = lang_key.lower()
                         if (
-                            language.lower() in lang_key.lower()
-                            or lang_key.lower() in language.lower()
+                            language_lower in lang_key_lower
+                            or lang_key_lower in language_lower
                         ):
                             return list(supported_voices[lang_key])
 
@@ -356,24 +595,33 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
                 # This should be available on Wyoming TTS entities
                 try:
                     # Try to get the TTS entity directly
-                    tts_entities = self.hass.data.get("tts", {})
-                    if hasattr(tts_entities, "get_entity"):
-                        entity = tts_entities.get_entity(engine_entity_id)
-                        if entity and hasattr(entity, "async_get_supported_voices"):
-                            voices = entity.async_get_supported_voices(language)
+                    get_entity = getattr(
+                        self.hass.data.get("tts", {}), "get_entity", None
+                    )
+                    if get_entity is not None:
+                        get_voices = getattr(
+                            get_entity(engine_entity_id),
+                            "async_get_supported_voices",
+                            None,
+                        )
+                        if get_voices is not None:
+                            voices = get_voices(language)
                             if voices:
                                 return [voice.voice_id for voice in voices]
                 except Exception:
                     pass
 
             # Method 3: Check for general voices attribute and filter by language
-            all_voices = state.attributes.get("voices") or state.attributes.get(
-                "available_voices"
-            )
+            all_voices = attrs.get("voices") or attrs.get("available_voices")
             if all_voices and isinstance(all_voices, (list, tuple)):
                 # Try to filter voices that contain the language code
+                language_lower = language.lower()
                 filtered_voices = [
-                    voice for voice in all_voices if language in voice.lower()
+                    voice
+                    for voice, voice_lower in self._lowered_voices(
+                        engine_entity_id, state, all_voices
+                    )
+                    if language_lower in voice_lower
                 ]
                 if filtered_voices:
                     return filtered_voices
@@ -381,7 +629,7 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
                 return list(all_voices)
 
             # Method 4: Check for voice_languages mapping
-            voice_languages = state.attributes.get("voice_languages", {})
+            voice_languages = attrs.get("voice_languages", {})
             if isinstance(voice_languages, dict) and language in voice_languages:
                 return voice_languages[language]
 
@@ -389,49 +637,63 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
             pass
         return []
 
-    def _format_language_label(self, lang_code: str) -> str:
+    def _lowered_voices(
+        self, engine_entity_id: str, state: State, all_voices: list[str] | tuple
+    ) -> list[tuple[str, str]]:
+        """Pair each voice with its lowercased name, once per engine state."""
+        cache_key = (engine_entity_id, state.last_updated)
+        lowered = self._lowered_voice_cache.get(cache_key)
+        if lowered is None:
+            lowered = [(voice, voice.lower()) for voice in all_voices]
+            self._lowered_voice_cache[cache_key] = lowered
+        return lowered
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _format_language_label(lang_code: str) -> str:
         """Format language code into a user-friendly label."""
-        # Common language mappings
-        lang_map = {
-            "de": "German",
-            "de-DE": "German (Germany)",
-            "de_DE": "German (Germany)",
-            "en": "English",
-            "en-US": "English (US)",
-            "en-GB": "English (UK)",
-            "en_US": "English (US)",
-            "en_GB": "English (UK)",
-            "fr": "French",
-            "fr-FR": "French (France)",
-            "fr_FR": "French (France)",
-            "es": "Spanish",
-            "es-ES": "Spanish (Spain)",
-            "es_ES": "Spanish (Spain)",
-            "it": "Italian",
-            "it-IT": "Italian (Italy)",
-            "it_IT": "Italian (Italy)",
-        }
-
-        friendly_name = lang_map.get(lang_code, lang_code.upper())
-        return f"{friendly_name} ({lang_code})"
-
-    async def _get_combined_voice_options(
-        self, engine_entity_id: str, language: str
+        label = _LANG_LABELS.get(lang_code)
+        if label is None:
+            label = f"{lang_code.upper()} ({lang_code})"
+        return label
+
+    def _get_combined_voice_options(
+        self,
+        engine_entity_id: str,
+        language: str,
+        available_voices: list[str] | None = None,
     ) -> list[dict]:
         """Get combined voice-speaker options in human-readable format."""
         if engine_entity_id == "auto":
             return []
 
-        # Get all available voices for the language
-        available_voices = await self._get_engine_voices_for_language(
-            engine_entity_id, language
-        )
+        # Get all available voices for the language unless the caller has them
+        if available_voices is None:
+            available_voices = self._get_engine_voices_for_language(
+                engine_entity_id, language
+            )
+
+        if not available_voices:
+            return []
+
+        # Fetch the engine state once and derive speakers for every voice from it
+        state = self._get_state(engine_entity_id)
+
+        # Reuse the options built for this engine state, e.g. after a validation error
+        cache_key = None
+        if state is not None:
+            cache_key = (engine_entity_id, language, state.last_updated)
+            cached_options = self._voice_options_cache.get(cache_key)
+            if cached_options is not None:
+                return cached_options
 
         combined_options = []
 
         for voice in available_voices:
             # Try to get speakers for this voice
-            speakers = await self._get_voice_speakers(engine_entity_id, voice)
+            speakers = (
+                self._cached_speakers(engine_entity_id, state, voice) if state else []
+            )
 
             if speakers:
                 # Create combined options for each speaker
@@ -452,10 +714,18 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
                     "label": display_name,
                 })
 
+        if cache_key is not None:
+            self._voice_options_cache[cache_key] = combined_options
         return combined_options
 
     def _format_voice_display_name(self, voice: str, speaker: str | None) -> str:
         """Format voice and speaker into human-readable display name."""
+        # Fast path for the common Piper format
+        parsed = _parse_voice(voice)
+        if parsed is not None:
+            _, speaker_part, pitch_part = parsed
+            return f"{speaker_part.capitalize()} ({pitch_part})"
+
         # Parse voice name structure: "language-speakername-pitch"
         if "-" in voice:
             parts = voice.split("-")
@@ -527,34 +797,54 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
             # No speaker, just voice
             return combined_value, None
 
-    async def _get_voice_speakers(
-        self, engine_entity_id: str, voice_name: str
-    ) -> list[str]:
+    def _get_voice_speakers(self, engine_entity_id: str, voice_name: str) -> list[str]:
         """Get available speakers for a specific voice in a TTS engine."""
         if engine_entity_id == "auto" or not voice_name:
             return []
 
-        try:
-            state = self.hass.states.get(engine_entity_id)
-            if not state:
-                return []
+        state = self._get_state(engine_entity_id)
+        if not state:
+            return []
+
+        return self._cached_speakers(engine_entity_id, state, voice_name)
+
+    def _cached_speakers(
+        self, engine_entity_id: str, state: State, voice_name: str
+    ) -> list[str]:
+        """Return speakers for a voice, cached until the engine state changes."""
+        cache_key = (engine_entity_id, voice_name, state.last_updated)
+        speakers = self._speaker_cache.get(cache_key)
+        if speakers is None:
+            speakers = self._speakers_from_attributes(state.attributes, voice_name)
+            self._speaker_cache[cache_key] = speakers
+        return speakers
+
+    def _speakers_from_attributes(
+        self, attrs: Mapping[str, Any], voice_name: str
+    ) -> list[str]:
+        """Derive available speakers for a voice from TTS engine attributes."""
+        if not voice_name:
+            return []
 
+        try:
             # Method 1: Check for Wyoming Protocol speaker attributes
             # Wyoming/Piper often stores speakers in voice-specific attributes
-            voice_speakers_key = f"speakers_{voice_name}"
-            voice_speakers = state.attributes.get(voice_speakers_key)
+            voice_speakers_key = _SPEAKERS_PREFIX + voice_name
+            voice_speakers = attrs.get(voice_speakers_key)
             if voice_speakers and isinstance(voice_speakers, (list, tuple)):
                 return list(voice_speakers)
 
             # Method 2: Check for general speakers attribute
-            all_speakers = state.attributes.get("speakers") or state.attributes.get(
-                "available_speakers"
-            )
+            all_speakers = attrs.get("speakers") or attrs.get("available_speakers")
             if all_speakers and isinstance(all_speakers, (list, tuple)):
                 return list(all_speakers)
 
             # Method 3: Check if the voice name contains speaker information
             # For Piper voices like "de_DE-thorsten-low", the speaker might be "thorsten"
+            parsed = _parse_voice(voice_name)
+            if parsed is not None:
+                return [parsed[1]]
+
             if "-" in voice_name:
                 parts = voice_name.split("-")
                 if len(parts) >= 2:
@@ -575,11 +865,11 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
 
                     # Also try extracting speaker names that aren't just quality indicators
                     for part in parts[1:]:  # Skip the first part (likely language)
-                        if part not in ["low", "medium", "high", "x_low", "x-low"]:
+                        if part not in _VOICE_QUALITIES:
                             potential_speakers.append(part)
 
-                    # Remove duplicates and return
-                    unique_speakers = list(set(potential_speakers))
+                    # Remove duplicates (keeping order) and return
+                    unique_speakers = list(dict.fromkeys(potential_speakers))
                     if unique_speakers:
                         _LOGGER.debug(
                             "Extracted speakers from voice name '%s': %s",
@@ -589,7 +879,7 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
                         return unique_speakers
 
             # Method 4: Check for voice-specific speaker mappings
-            voice_speaker_mapping = state.attributes.get("voice_speakers", {})
+            voice_speaker_mapping = attrs.get("voice_speakers", {})
             if (
                 isinstance(voice_speaker_mapping, dict)
                 and voice_name in voice_speaker_mapping
@@ -601,23 +891,22 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
                     return [speakers]
 
             # Method 5: For Wyoming TTS, check supported_options for speaker capability
-            supported_options = state.attributes.get("supported_options", [])
+            supported_options = attrs.get("supported_options", [])
             if "speaker" in supported_options:
                 # If speaker is supported but no specific speakers listed,
                 # this might be a multi-speaker voice - return empty to show text input
                 return []
 
         except Exception as e:
-            _LOGGER.warning(
-                "Error getting speakers for voice %s in engine %s: %s",
-                voice_name,
-                engine_entity_id,
-                e,
-            )
+            _LOGGER.warning("Error getting speakers for voice %s: %s", voice_name, e)
         return []
 
-    async def _validate_voice_speaker_combination(
-        self, engine_entity_id: str, voice_name: str, speaker_name: str
+    def _validate_voice_speaker_combination(
+        self,
+        engine_entity_id: str,
+        voice_name: str,
+        speaker_name: str,
+        available_voices: list[str] | None = None,
     ) -> bool:
         """Validate that a voice and speaker combination is valid for the engine."""
         if engine_entity_id == "auto" or not voice_name:
@@ -625,25 +914,24 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
 
         try:
             # For Wyoming TTS, check if the speaker is valid for the voice
-            if (
-                "wyoming" in engine_entity_id.lower()
-                or "piper" in engine_entity_id.lower()
-            ):
-                available_speakers = await self._get_voice_speakers(
+            if self._engine_kind(engine_entity_id) in ("wyoming", "piper"):
+                available_speakers = self._get_voice_speakers(
                     engine_entity_id, voice_name
                 )
                 if available_speakers and speaker_name:
-                    return speaker_name in available_speakers
+                    return speaker_name in frozenset(available_speakers)
                 # If no speakers listed but speaker provided, assume it might be valid
                 return True
 
             # For other engines, check if combined voice-speaker exists
             if speaker_name:
-                available_voices = await self._get_engine_voices_for_language(
-                    engine_entity_id, self._current_config.get("tts_language", "de")
-                )
+                if available_voices is None:
+                    available_voices = self._get_engine_voices_for_language(
+                        engine_entity_id,
+                        self._current_config.get("tts_language", "de"),
+                    )
                 combined_name = f"{voice_name}-{speaker_name}"
-                return combined_name in (available_voices or [])
+                return combined_name in frozenset(available_voices or ())
 
             return True
         except Exception as e:
@@ -656,29 +944,39 @@ class VoiceReplayOptionsFlowHandler(config_entries.OptionsFlow):
             )
             return True  # Assume valid if validation fails
 
-    async def _is_wyoming_engine(self, engine_entity_id: str) -> bool:
+    def _engine_kind(self, engine_entity_id: str) -> str:
+        """Classify an engine as "auto", "wyoming", "piper" or "other" by its id."""
+        kind = self._engine_kind_cache.get(engine_entity_id)
+        if kind is None:
+            engine_id_lower = engine_entity_id.lower()
+            if engine_entity_id == "auto":
+                kind = "auto"
+            elif "wyoming" in engine_id_lower:
+                kind = "wyoming"
+            elif "piper" in engine_id_lower:
+                kind = "piper"
+            else:
+                kind = "other"
+            self._engine_kind_cache[engine_entity_id] = kind
+        return kind
+
+    def _is_wyoming_engine(self, engine_entity_id: str) -> bool:
         """Check if an engine is Wyoming-based."""
         if engine_entity_id == "auto":
             return False
 
         try:
-            state = self.hass.states.get(engine_entity_id)
+            state = self._get_state(engine_entity_id)
             if not state:
                 return False
 
             # Check various indicators of Wyoming TTS
-            if "wyoming" in engine_entity_id.lower():
-                return True
-
-            supported_options = state.attributes.get("supported_options", [])
-            if "speaker" in supported_options:
-                return True
-
-            integration = state.attributes.get("integration")
-            platform = state.attributes.get("platform")
-            if integration == "wyoming" or platform == "wyoming":
-                return True
-
-            return False
+            attrs = state.attributes
+            return (
+                self._engine_kind(engine_entity_id) == "wyoming"
+                or "speaker" in attrs.get("supported_options", ())
+                or attrs.get("integration") == "wyoming"
+                or attrs.get("platform") == "wyoming"
+            )
         except Exception:
             return False
@@ -17,16 +17,19 @@ def register_services(hass: HomeAssistant) -> None:
     if hass.services.has_service(DOMAIN, SERVICE_REPLAY):
         return
 
+    # Create the data container once instead of on every call
+    data = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_KEY, {})
+
     async def handle_replay(call: ServiceCall) -> None:
         """Handle the replay service call."""
+        call_data = call.data
         payload: dict[str, Any] = {
-            "url": call.data.get("url"),
-            "media_content": call.data.get("media_content"),
-            "entity_id": call.data.get("entity_id"),
+            "url": call_data.get("url"),
+            "media_content": call_data.get("media_content"),
+            "entity_id": call_data.get("entity_id"),
         }
-        hass.data.setdefault(DOMAIN, {})
-        hass.data[DOMAIN].setdefault(DATA_KEY, {})
-        hass.data[DOMAIN][DATA_KEY]["last_replay"] = payload
-        _LOGGER.info("voice-replay.replay called: %s", payload)
+        data["last_replay"] = payload
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("voice-replay.replay called: %s", payload)
 
     hass.services.async_register(DOMAIN, SERVICE_REPLAY, handle_replay)
@@ -322,7 +322,13 @@ class VoiceReplayCard extends LitElement {
   async _startRecording() {
     try {
       const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
-      this._mediaRecorder = new MediaRecorder(stream);
+      // Ask for a compact speech codec the browser supports instead of its default
+      const mimeType = ['audio/webm;codecs=opus', 'audio/webm', 'audio/mp4']
+        .find(type => MediaRecorder.isTypeSupported(type));
+      this._mediaRecorder = mimeType
+        ? new MediaRecorder(stream, { mimeType, audioBitsPerSecond: 64000 })
+        : new MediaRecorder(stream);
+      this._recordingMimeType = this._mediaRecorder.mimeType || mimeType || 'audio/webm';
       this._recordedChunks = [];
 
       this._mediaRecorder.ondataavailable = (event) => {
@@ -337,7 +343,8 @@ class VoiceReplayCard extends LitElement {
         this.requestUpdate();
       };
 
-      this._mediaRecorder.start();
+      // Flush data every second so long recordings don't build up in one buffer
+      this._mediaRecorder.start(1000);
       this._isRecording = true;
       this._showStatus('Recording... Click to stop', 'info');
       this.requestUpdate();
@@ -365,20 +372,23 @@ class VoiceReplayCard extends LitElement {
     }
 
     try {
-      const blob = new Blob(this._recordedChunks, { type: 'audio/webm' });
-      const formData = new FormData();
-      formData.append('audio', blob, 'recording.webm');
-      formData.append('entity_id', this._selectedPlayer);
-      formData.append('type', 'recording');
+      const mimeType = this._recordingMimeType || 'audio/webm';
+      const blob = new Blob(this._recordedChunks, { type: mimeType });
+      // Send the audio as the raw request body; the other fields go in the query
+      const params = new URLSearchParams({
+        entity_id: this._selectedPlayer,
+        type: 'recording'
+      });
 
       this._showStatus('Uploading and playing...', 'info');
 
-      const response = await fetch('/api/voice-replay/upload', {
+      const response = await fetch(`/api/voice-replay/upload?${params}`, {
         method: 'POST',
         headers: {
-          'Authorization': `Bearer ${this.hass.auth.accessToken}`
+          'Authorization': `Bearer ${this.hass.auth.accessToken}`,
+          'Content-Type': mimeType
         },
-        body: formData
+        body: blob
       });
 
       if (response.ok) {
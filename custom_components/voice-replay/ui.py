@@ -6,7 +6,7 @@ import logging
 
 from aiohttp import web
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 
 from .const import DOMAIN
 
@@ -20,6 +20,36 @@ MEDIA_PLAYERS_NAME = f"api:{DOMAIN}:media_players"
 TTS_CONFIG_URL = f"/api/{DOMAIN}/tts_config"
 TTS_CONFIG_NAME = f"api:{DOMAIN}:tts_config"
 
+# hass.data key of the media players view once the views above are registered
+_MEDIA_PLAYERS_VIEW = f"{DOMAIN}_media_players_view"
+
+# Uploaded audio is written to disk in chunks of this size
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Uploads larger than this are rejected (a voice message is far smaller)
+_MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
+# Fields a raw-body upload may pass in the query string
+_QUERY_FIELDS = ("entity_id", "type", "text")
+
+# Entity id fragments that identify Sonos speakers
+_SONOS_KEYWORDS = ("sonos", "play:1", "play:3", "play:5")
+
+
+def _is_sonos_entity_id(entity_id: str) -> bool:
+    """Return True if the media player entity id looks like a Sonos speaker."""
+    entity_id_lower = entity_id.lower()
+    return any(keyword in entity_id_lower for keyword in _SONOS_KEYWORDS)
+
+
+def _remove_if_exists(path: str) -> None:
+    """Remove a file, ignoring it if it is already gone."""
+    import contextlib
+    import os
+
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
 
 class VoiceReplayUploadView(HomeAssistantView):
     """Handle audio upload and playback."""
@@ -61,37 +91,91 @@ class VoiceReplayUploadView(HomeAssistantView):
 
     async def post(self, request: web.Request) -> web.Response:
         """Handle POST request for audio upload."""
+        fields = {}
+        # Kept apart from fields so request data can never name a server path
+        upload_path: str | None = None
         try:
-            reader = await request.multipart()
-            fields = {}
+            if request.content_type.startswith("audio/"):
+                # Raw audio body, with the other fields in the query string
+                query = request.query
+                fields.update(
+                    (key, query[key]) for key in _QUERY_FIELDS if key in query
+                )
+                fields["content_type"] = request.content_type
+                upload_path = await self._receive_audio(request.content.read)
+            else:
+                reader = await request.multipart()
 
-            async for field in reader:
-                if field.name == "audio":
-                    fields["audio"] = await field.read()
-                else:
-                    fields[field.name] = await field.text()
+                async for field in reader:
+                    if field.name == "audio":
+                        upload_path = await self._receive_audio(field.read_chunk)
+                    else:
+                        fields[field.name] = await field.text()
 
             entity_id = fields.get("entity_id")
             request_type = fields.get("type", "audio")
 
             if not entity_id:
-                return web.json_response({"error": "Missing entity_id"}, status=400)
+                return self.json({"error": "Missing entity_id"}, status_code=400)
 
             # Handle TTS requests
             if request_type == "tts":
                 text = fields.get("text")
                 if not text:
-                    return web.json_response(
-                        {"error": "Missing text for TTS"}, status=400
-                    )
+                    return self.json({"error": "Missing text for TTS"}, status_code=400)
                 return await self._handle_tts_request(entity_id, text)
 
             # Handle audio recording
-            return await self._handle_audio_recording(entity_id, fields)
+            return await self._handle_audio_recording(entity_id, fields, upload_path)
 
+        except web.HTTPRequestEntityTooLarge:
+            _LOGGER.warning("Rejected upload larger than %d bytes", _MAX_UPLOAD_BYTES)
+            return self.json({"error": "Upload too large"}, status_code=413)
         except Exception as e:
             _LOGGER.error("Error handling upload request: %s", e)
-            return web.json_response({"error": str(e)}, status=500)
+            return self.json({"error": str(e)}, status_code=500)
+        finally:
+            # Drop a received upload that was never moved into place
+            if upload_path:
+                await self.hass.async_add_executor_job(_remove_if_exists, upload_path)
+
+    async def _receive_audio(self, read_chunk) -> str | None:
+        """Stream uploaded audio to a temporary file in the media folder.
+
+        read_chunk(size) is awaited until it returns an empty chunk.
+
+        Returns the temporary file path, or None if no media folder is set up.
+        """
+        import functools
+        import os
+        import tempfile
+
+        media_folder_path = self.hass.data.get(DOMAIN, {}).get("media_folder_path")
+        if not media_folder_path:
+            return None
+
+        fd, upload_path = await self.hass.async_add_executor_job(
+            functools.partial(
+                tempfile.mkstemp,
+                prefix="voice_recording_",
+                suffix=".part",
+                dir=media_folder_path,
+            )
+        )
+        try:
+            with os.fdopen(fd, "wb") as upload_file:
+                received = 0
+                while chunk := await read_chunk(_UPLOAD_CHUNK_SIZE):
+                    received += len(chunk)
+                    if received > _MAX_UPLOAD_BYTES:
+                        raise web.HTTPRequestEntityTooLarge(
+                            max_size=_MAX_UPLOAD_BYTES, actual_size=received
+                        )
+                    await self.hass.async_add_executor_job(upload_file.write, chunk)
+        except BaseException:
+            await self.hass.async_add_executor_job(_remove_if_exists, upload_path)
+            raise
+        return upload_path
 
     async def _handle_tts_request(self, entity_id: str, text: str) -> web.Response:
         """Handle text-to-speech request using configured TTS settings."""
@@ -114,9 +198,7 @@ class VoiceReplayUploadView(HomeAssistantView):
             )
 
             if not tts_entity:
-                return web.json_response(
-                    {"error": "No TTS engine available"}, status=400
-                )
+                return self.json({"error": "No TTS engine available"}, status_code=400)
 
             # Play TTS on all target entities
             await self._play_tts_on_targets(
@@ -130,12 +212,12 @@ class VoiceReplayUploadView(HomeAssistantView):
 
             # Return success message
             if len(target_entity_ids) > 1:
-                return web.json_response({
+                return self.json({
                     "status": "success",
                     "message": f"Playing TTS audio via {tts_entity} on {len(target_entity_ids)} speakers",
                 })
             else:
-                return web.json_response({
+                return self.json({
                     "status": "success",
                     "message": f"Playing TTS audio via {tts_entity}",
                 })
@@ -295,10 +377,7 @@ class VoiceReplayUploadView(HomeAssistantView):
     ) -> None:
         """Play TTS on all target entities."""
         for target_id in target_entity_ids:
-            is_sonos = any(
-                keyword in target_id.lower()
-                for keyword in ["sonos", "play:1", "play:3", "play:5"]
-            )
+            is_sonos = _is_sonos_entity_id(target_id)
 
             # Prepare text for Sonos if needed
             tts_text = await self._prepare_tts_text_for_target(
@@ -432,11 +511,11 @@ class VoiceReplayUploadView(HomeAssistantView):
                 configured_language,
                 tts_error,
             )
-            return web.json_response(
+            return self.json(
                 {
                     "error": f"Language '{configured_language}' not supported by {tts_entity}. {error_msg}"
                 },
-                status=400,
+                status_code=400,
             )
         elif "voice" in error_msg.lower():
             _LOGGER.error(
@@ -445,16 +524,16 @@ class VoiceReplayUploadView(HomeAssistantView):
                 configured_voice,
                 tts_error,
             )
-            return web.json_response(
+            return self.json(
                 {
                     "error": f"Voice '{configured_voice}' not supported by {tts_entity}. {error_msg}"
                 },
-                status=400,
+                status_code=400,
             )
         else:
             _LOGGER.error("TTS service error: %s", tts_error)
-            return web.json_response(
-                {"error": f"TTS service failed: {error_msg}"}, status=500
+            return self.json(
+                {"error": f"TTS service failed: {error_msg}"}, status_code=500
             )
 
     async def _get_available_tts_engine(self) -> str | None:
@@ -694,7 +773,7 @@ class VoiceReplayUploadView(HomeAssistantView):
         self.hass.async_create_task(restore_volume())
 
     async def _handle_audio_recording(
-        self, entity_id: str, fields: dict
+        self, entity_id: str, fields: dict, upload_path: str | None
     ) -> web.Response:
         """Handle audio recording upload and playback using media source."""
         import os
@@ -703,10 +782,6 @@ class VoiceReplayUploadView(HomeAssistantView):
         # Expand group entity_id to all member entity_ids
         target_entity_ids = self._expand_entity_ids(entity_id)
 
-        audio_data = fields.get("audio")
-        if not audio_data:
-            return web.json_response({"error": "Missing audio data"}, status=400)
-
         # Get content type from frontend
         provided_content_type = fields.get("content_type", "audio/webm")
 
@@ -722,9 +797,12 @@ class VoiceReplayUploadView(HomeAssistantView):
         # Get the media folder path from integration data
         media_folder_path = self.hass.data.get(DOMAIN, {}).get("media_folder_path")
         if not media_folder_path:
-            return web.json_response(
-                {"error": "Media folder not configured"}, status=500
-            )
+            return self.json({"error": "Media folder not configured"}, status_code=500)
+
+        if not upload_path or not await self.hass.async_add_executor_job(
+            os.path.getsize, upload_path
+        ):
+            return self.json({"error": "Missing audio data"}, status_code=400)
 
         # Create unique filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[
@@ -733,21 +811,14 @@ class VoiceReplayUploadView(HomeAssistantView):
         filename = f"voice_recording_{timestamp}{file_extension}"
         file_path = os.path.join(media_folder_path, filename)
 
-        # Save audio to media folder
+        # Move the received upload into place in the media folder
         try:
-            import asyncio
-
-            # Use asyncio to avoid blocking the event loop
-            def write_file():
-                with open(file_path, "wb") as f:
-                    f.write(audio_data)
-
-            await asyncio.get_event_loop().run_in_executor(None, write_file)
+            await self.hass.async_add_executor_job(os.replace, upload_path, file_path)
             _LOGGER.info("Saved voice recording to: %s", file_path)
         except Exception as e:
             _LOGGER.error("Failed to save voice recording: %s", e)
-            return web.json_response(
-                {"error": f"Failed to save recording: {str(e)}"}, status=500
+            return self.json(
+                {"error": f"Failed to save recording: {str(e)}"}, status_code=500
             )
 
         # Convert WebM to MP3 if needed (updates file in place)
@@ -783,12 +854,12 @@ class VoiceReplayUploadView(HomeAssistantView):
 
         # Return success message
         if len(target_entity_ids) > 1:
-            return web.json_response({
+            return self.json({
                 "status": "success",
                 "message": f"Playing audio via media source on {len(target_entity_ids)} speakers",
             })
         else:
-            return web.json_response({
+            return self.json({
                 "status": "success",
                 "message": "Playing audio via media source",
             })
@@ -817,11 +888,12 @@ class VoiceReplayUploadView(HomeAssistantView):
         ) or ("mp4" in provided_content_type and file_extension == ".mp3")
 
         if should_convert:
+            import functools
             import os
             import shutil
             import subprocess
 
-            if shutil.which("ffmpeg"):
+            if await self.hass.async_add_executor_job(shutil.which, "ffmpeg"):
                 try:
                     # Determine source format for logging
                     if "mp4" in provided_content_type:
@@ -857,18 +929,23 @@ class VoiceReplayUploadView(HomeAssistantView):
                         temp_converted_path,
                     ]
 
-                    result = subprocess.run(
-                        command,
-                        check=True,
-                        capture_output=True,
-                        text=True,
+                    # Run ffmpeg in the executor so the event loop is not blocked
+                    result = await self.hass.async_add_executor_job(
+                        functools.partial(
+                            subprocess.run,
+                            command,
+                            check=True,
+                            capture_output=True,
+                            text=True,
+                        )
                     )
                     _LOGGER.debug("FFmpeg conversion stdout: %s", result.stdout)
                     _LOGGER.debug("FFmpeg conversion stderr: %s", result.stderr)
 
                     # Replace original file with converted file
-                    os.remove(temp_path)
-                    os.rename(temp_converted_path, temp_path)
+                    await self.hass.async_add_executor_job(
+                        os.replace, temp_converted_path, temp_path
+                    )
 
                     _LOGGER.info(
                         "Successfully converted %s to MP3",
@@ -893,13 +970,12 @@ class VoiceReplayUploadView(HomeAssistantView):
     async def _schedule_media_file_cleanup(self, file_path: str, filename: str) -> None:
         """Schedule cleanup of media files after 10 minutes."""
         import asyncio
-        import os
 
         async def cleanup_media_file():
             await asyncio.sleep(600)  # 10 minutes
             try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
+                # Remove in the executor so the event loop is not blocked
+                await self.hass.async_add_executor_job(_remove_if_exists, file_path)
                 _LOGGER.debug("Cleaned up media file: %s", filename)
             except Exception as cleanup_error:
                 _LOGGER.warning("Could not cleanup media file: %s", cleanup_error)
@@ -920,14 +996,15 @@ class VoiceReplayUploadView(HomeAssistantView):
             "Playing audio via media source on %s: %s", entity_id, media_content_id
         )
 
-        # Add debugging information
-        _LOGGER.info(
-            "File exists at path: %s = %s", file_path, os.path.exists(file_path)
-        )
-        if os.path.exists(file_path):
-            file_size = os.path.getsize(file_path)
-            _LOGGER.info("File size: %s bytes", file_size)
-            if file_size == 0:
+        # Add debugging information (one stat call, off the event loop)
+        try:
+            file_stat = await self.hass.async_add_executor_job(os.stat, file_path)
+        except FileNotFoundError:
+            _LOGGER.info("File exists at path: %s = %s", file_path, False)
+        else:
+            _LOGGER.info("File exists at path: %s = %s", file_path, True)
+            _LOGGER.info("File size: %s bytes", file_stat.st_size)
+            if file_stat.st_size == 0:
                 _LOGGER.warning("Audio file is empty!")
 
         # Check media player state
@@ -944,10 +1021,7 @@ class VoiceReplayUploadView(HomeAssistantView):
 
         try:
             # Check if this is a Sonos speaker - use direct serving for better reliability
-            is_sonos = any(
-                keyword in entity_id.lower()
-                for keyword in ["sonos", "play:1", "play:3", "play:5"]
-            )
+            is_sonos = _is_sonos_entity_id(entity_id)
 
             if is_sonos:
                 _LOGGER.info(
@@ -1059,9 +1133,22 @@ class VoiceReplayUploadView(HomeAssistantView):
 
         filename = os.path.basename(file_path)
 
-        # Create direct URL using Home Assistant's built-in media serving
-        external_url = self.hass.config.external_url or "http://localhost:8123"
-        builtin_media_url = f"{external_url}/media/local/{filename}"
+        from datetime import timedelta
+
+        from homeassistant.components.http.auth import async_sign_path
+        from homeassistant.helpers.network import NoURLAvailableError, get_url
+
+        # Create direct URL using Home Assistant's built-in media serving.
+        # Prefer the internal URL so LAN players don't go through the
+        # external address, and sign the path so the player can fetch it.
+        try:
+            base_url = get_url(self.hass)
+        except NoURLAvailableError:
+            base_url = "http://localhost:8123"
+        signed_path = async_sign_path(
+            self.hass, f"/media/local/{filename}", timedelta(minutes=5)
+        )
+        builtin_media_url = f"{base_url}{signed_path}"
 
         _LOGGER.info("Playing audio via direct HTTP serving")
         _LOGGER.info("Built-in HA media URL: %s", builtin_media_url)
@@ -1077,10 +1164,7 @@ class VoiceReplayUploadView(HomeAssistantView):
             content_type = "audio/mpeg"
 
         # Check if this is a Sonos speaker
-        is_sonos = any(
-            keyword in entity_id.lower()
-            for keyword in ["sonos", "play:1", "play:3", "play:5"]
-        )
+        is_sonos = _is_sonos_entity_id(entity_id)
 
         if is_sonos:
             await self._handle_sonos_direct_playback(
@@ -1233,24 +1317,30 @@ class VoiceReplayUploadView(HomeAssistantView):
         import shutil
         import subprocess
 
+        def probe_duration() -> float | None:
+            if not (os.path.exists(file_path) and shutil.which("ffprobe")):
+                return None
+            result = subprocess.run(
+                [
+                    "ffprobe",
+                    "-v",
+                    "quiet",
+                    "-show_entries",
+                    "format=duration",
+                    "-of",
+                    "csv=p=0",
+                    file_path,
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            return float(result.stdout.strip())
+
         try:
-            if os.path.exists(file_path) and shutil.which("ffprobe"):
-                result = subprocess.run(
-                    [
-                        "ffprobe",
-                        "-v",
-                        "quiet",
-                        "-show_entries",
-                        "format=duration",
-                        "-of",
-                        "csv=p=0",
-                        file_path,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                duration = float(result.stdout.strip())
+            # Probe in the executor so the event loop is not blocked
+            duration = await self.hass.async_add_executor_job(probe_duration)
+            if duration is not None:
                 return max(duration + 1.0, 3.0)
         except Exception as e:
             _LOGGER.debug("Could not determine audio duration: %s", e)
@@ -1330,55 +1420,108 @@ class VoiceReplayMediaPlayersView(HomeAssistantView):
     def __init__(self, hass: HomeAssistant) -> None:
         super().__init__()
         self.hass = hass
+        # (body, etag) of the last response, dropped when a media player changes
+        self._cache: tuple[bytes, str] | None = None
+        # The cache is only kept while this state listener is attached
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+
+    def async_listen(self) -> CALLBACK_TYPE:
+        """Invalidate the cached response whenever a media player state changes.
+
+        Returns a callback that stops listening; until the next async_listen
+        the response is rebuilt on every request.
+        """
+        from homeassistant.const import EVENT_STATE_CHANGED
+
+        @callback
+        def _async_state_changed(event: Event) -> None:
+            if event.data["entity_id"].startswith("media_player."):
+                self._cache = None
+
+        self._unsub_state_changed = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, _async_state_changed
+        )
+
+        @callback
+        def _async_stop() -> None:
+            if self._unsub_state_changed is not None:
+                self._unsub_state_changed()
+                self._unsub_state_changed = None
+            self._cache = None
+
+        return _async_stop
 
     async def get(self, request: web.Request) -> web.Response:
         """Return list of available media players with Sonos groups at the top."""
+        cached = self._cache
+        if cached is None:
+            import hashlib
+
+            from homeassistant.helpers.json import json_bytes
+
+            body = json_bytes(self._collect_media_players())
+            cached = (body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"')
+            if self._unsub_state_changed is not None:
+                self._cache = cached
+        body, etag = cached
+
+        # Let the browser keep the list but revalidate it on every request
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    def _collect_media_players(self) -> list[dict]:
+        """Build the media player list, Sonos groups first."""
         media_players = []
         sonos_groups = []
         individual_players = []
 
         _LOGGER.info("Processing media players request...")
 
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
         # First pass: collect all media players and identify Sonos entities
-        for state in self.hass.states.async_all():
-            if state.entity_id.startswith("media_player."):
-                player_info = {
-                    "entity_id": state.entity_id,
-                    "name": state.attributes.get("friendly_name", state.entity_id),
-                    "state": state.state,
-                    "is_sonos": self._is_sonos_entity(state),
-                    "group_members": state.attributes.get("group_members", []),
-                    "device_class": state.attributes.get("device_class"),
-                }
-
-                # Check if this is a Sonos group coordinator
-                if (
-                    player_info["is_sonos"]
-                    and len(player_info["group_members"]) > 1
-                    and state.entity_id in player_info["group_members"]
-                ):
-                    # This is a Sonos group coordinator
-                    group_info = player_info.copy()
-                    group_info["name"] = (
-                        f"🔊 {player_info['name']} Group ({len(player_info['group_members'])} speakers)"
-                    )
-                    group_info["is_group"] = True
-                    sonos_groups.append(group_info)
+        for state in self.hass.states.async_all("media_player"):
+            entity_id = state.entity_id
+            attrs = state.attributes
+            is_sonos = self._is_sonos_entity(state)
+            group_members = attrs.get("group_members", [])
+            player_info = {
+                "entity_id": entity_id,
+                "name": attrs.get("friendly_name", entity_id),
+                "state": state.state,
+                "is_sonos": is_sonos,
+                "group_members": group_members,
+                "device_class": attrs.get("device_class"),
+            }
+
+            # Check if this is a Sonos group coordinator
+            if is_sonos and len(group_members) > 1 and entity_id in group_members:
+                # This is a Sonos group coordinator
+                group_info = player_info.copy()
+                group_info["name"] = (
+                    f"🔊 {player_info['name']} Group ({len(group_members)} speakers)"
+                )
+                group_info["is_group"] = True
+                sonos_groups.append(group_info)
+                if debug:
                     _LOGGER.debug(
                         "Added Sonos group: %s (%s) with %d members",
                         group_info["name"],
-                        group_info["entity_id"],
-                        len(player_info["group_members"]),
+                        entity_id,
+                        len(group_members),
                     )
 
-                # Add to individual players list
-                individual_players.append(player_info)
+            # Add to individual players list
+            individual_players.append(player_info)
+            if debug:
                 _LOGGER.debug(
                     "Added media player: %s (%s) - %s %s",
                     player_info["name"],
-                    player_info["entity_id"],
+                    entity_id,
                     player_info["state"],
-                    "(Sonos)" if player_info["is_sonos"] else "",
+                    "(Sonos)" if is_sonos else "",
                 )
 
         # Sort groups and individual players alphabetically by name
@@ -1394,9 +1537,12 @@ class VoiceReplayMediaPlayersView(HomeAssistantView):
             len(sonos_groups),
             len(individual_players),
         )
-        _LOGGER.debug("Returning media players: %s", [p["name"] for p in media_players])
+        if debug:
+            _LOGGER.debug(
+                "Returning media players: %s", [p["name"] for p in media_players]
+            )
 
-        return web.json_response(media_players)
+        return media_players
 
     def _is_sonos_entity(self, state) -> bool:
         """Check if the media player entity is a Sonos device."""
@@ -1449,7 +1595,7 @@ class VoiceReplayTTSConfigView(HomeAssistantView):
                     # Fallback - assume basic TTS is available
                     tts_services.append("speak")
 
-            return web.json_response({
+            return self.json({
                 "available": len(tts_services) > 0,
                 "services": tts_services,
                 "default_service": "speak" if tts_services else None,
@@ -1459,13 +1605,33 @@ class VoiceReplayTTSConfigView(HomeAssistantView):
             })
         except Exception as e:
             _LOGGER.error("Error getting TTS config: %s", e)
-            return web.json_response({"available": False, "error": str(e)})
-
-
-def register_ui_view(hass: HomeAssistant, target_url: str = None) -> None:
-    """Register the API views for backend functionality."""
-    hass.http.register_view(VoiceReplayUploadView(hass))
-    hass.http.register_view(VoiceReplayMediaPlayersView(hass))
-    hass.http.register_view(VoiceReplayTTSConfigView(hass))
-
-    _LOGGER.debug("API views registered - frontend card is in separate repository")
+            return self.json({"available": False, "error": str(e)})
+
+
+# API views registered by register_ui_view
+_VIEWS = (
+    VoiceReplayUploadView,
+    VoiceReplayMediaPlayersView,
+    VoiceReplayTTSConfigView,
+)
+
+
+def register_ui_view(hass: HomeAssistant, target_url: str = None) -> CALLBACK_TYPE:
+    """Register the API views for backend functionality.
+
+    HTTP views can't be unregistered, so they are registered once per run and
+    survive config entry reloads. Returns a callback that stops the media
+    players state listener when the entry unloads.
+    """
+    # Kept outside hass.data[DOMAIN], which is dropped on unload
+    media_players_view = hass.data.get(_MEDIA_PLAYERS_VIEW)
+    if media_players_view is None:
+        views = {view_cls: view_cls(hass) for view_cls in _VIEWS}
+        for view in views.values():
+            hass.http.register_view(view)
+        media_players_view = views[VoiceReplayMediaPlayersView]
+        hass.data[_MEDIA_PLAYERS_VIEW] = media_players_view
+        _LOGGER.debug("API views registered - frontend card is in separate repository")
+
+    # The media players view drops its cached list when a media player changes
+    return media_players_view.async_listen()